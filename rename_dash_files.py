@@ -1,8 +1,153 @@
 #!/usr/bin/env python3
+import argparse
+import concurrent.futures
+import ctypes
+import errno
 import os
+import stat
 import sys
 import select
-from pathlib import Path
+from itertools import groupby
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# renameat2(2) with RENAME_NOREPLACE gives an atomic rename-unless-target-
+# exists; plain rename(2) silently replaces an existing target on POSIX.
+_RENAME_NOREPLACE = 1
+_AT_FDCWD = -100
+
+_libc = None
+_renameat2 = None
+if sys.platform == 'linux':
+    try:
+        _libc = ctypes.CDLL('libc.so.6', use_errno=True)
+        _renameat2 = _libc.renameat2
+        _renameat2.argtypes = (ctypes.c_int, ctypes.c_char_p,
+                               ctypes.c_int, ctypes.c_char_p,
+                               ctypes.c_uint)
+        _renameat2.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _renameat2 = None
+
+def _rename_noreplace(old, new, dir_fd=None):
+    """
+    Rename old to new, raising FileExistsError if new already exists.
+
+    On Linux this is a single renameat2(RENAME_NOREPLACE) syscall: the
+    kernel checks and renames atomically, saving the per-item stat and
+    closing the race between an existence check and the rename. Where
+    renameat2 is unavailable (other platforms, or filesystems that
+    reject the flag) it falls back to an lstat pre-check plus rename.
+
+    Args:
+        old: Source path, or a name relative to dir_fd
+        new: Target path, or a name relative to dir_fd
+        dir_fd: Optional directory fd both names are relative to
+    """
+    if _renameat2 is not None:
+        fd = _AT_FDCWD if dir_fd is None else dir_fd
+        if _renameat2(fd, os.fsencode(old), fd, os.fsencode(new),
+                      _RENAME_NOREPLACE) == 0:
+            return
+        err = ctypes.get_errno()
+        if err not in (errno.ENOSYS, errno.EINVAL):
+            raise OSError(err, os.strerror(err), old)
+        # Kernel or filesystem lacks RENAME_NOREPLACE; fall through
+
+    exists = True
+    try:
+        os.lstat(new, dir_fd=dir_fd)
+    except FileNotFoundError:
+        exists = False
+    if exists:
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), new)
+    if dir_fd is None:
+        os.rename(old, new)
+    else:
+        os.rename(old, new, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+
+# Prefix that marks an item for renaming. Compared via a slice
+# (name[:3] == PREFIX) rather than str.startswith, which skips the
+# method lookup and argument parsing on the per-entry hot path. Match
+# sites test the first character alone before the slice: almost no
+# filename starts with a space, so the cheap single-character compare
+# rejects nearly every entry without building the slice at all.
+PREFIX = ' - '
+_PREFIX_BYTES = b' - '
+
+# getdents64(2) has no libc wrapper number in ctypes, so the syscall
+# number is per-architecture; unknown architectures use os.scandir.
+_SYS_GETDENTS64 = None
+if sys.platform == 'linux' and _libc is not None:
+    _SYS_GETDENTS64 = {'x86_64': 217, 'aarch64': 61}.get(os.uname().machine)
+
+_DT_UNKNOWN = 0
+_DT_DIR = 4
+
+def _list_dir_scandir(dir_fd):
+    """
+    List the directories and prefix matches in a directory via
+    os.scandir on its fd, as (name, is_dir, is_match) triples. is_dir
+    never follows symlinks; other entries are dropped here since the
+    walk has no use for them.
+    """
+    out = []
+    with os.scandir(dir_fd) as it:
+        for entry in it:
+            name = entry.name
+            is_dir = entry.is_dir(follow_symlinks=False)
+            is_match = (name[0] == ' '
+                        and name[:3] == PREFIX and len(name) > 3)
+            if is_dir or is_match:
+                out.append((name, is_dir, is_match))
+    return out
+
+def _list_dir_getdents(dir_fd):
+    """
+    List a directory by calling getdents64(2) directly and parsing the
+    linux_dirent64 records in the returned buffer. One syscall brings
+    back thousands of entries, the prefix test runs on the raw name
+    bytes, and no DirEntry objects are allocated; a Python string is
+    only built per entry name that survives into the result.
+
+    d_type usually answers is_dir for free; filesystems that report
+    DT_UNKNOWN get one lstat through the fd.
+    """
+    out = []
+    buf = ctypes.create_string_buffer(32768)
+    while True:
+        nread = _libc.syscall(_SYS_GETDENTS64, dir_fd, buf, len(buf))
+        if nread < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        if nread == 0:
+            return out
+        raw = buf.raw[:nread]
+        pos = 0
+        while pos < nread:
+            # linux_dirent64: u64 d_ino, s64 d_off, u16 d_reclen,
+            # u8 d_type, then the NUL-terminated d_name at offset 19
+            reclen = int.from_bytes(raw[pos + 16:pos + 18], 'little')
+            d_type = raw[pos + 18]
+            name_bytes = raw[pos + 19:raw.index(b'\0', pos + 19)]
+            pos += reclen
+            if name_bytes in (b'.', b'..'):
+                continue
+            if d_type == _DT_UNKNOWN:
+                mode = os.lstat(name_bytes, dir_fd=dir_fd).st_mode
+                is_dir = stat.S_ISDIR(mode)
+            else:
+                is_dir = d_type == _DT_DIR
+            is_match = (name_bytes[0] == 0x20
+                        and name_bytes[:3] == _PREFIX_BYTES
+                        and len(name_bytes) > 3)
+            if is_dir or is_match:
+                out.append((os.fsdecode(name_bytes), is_dir, is_match))
+
+_list_dir = _list_dir_getdents if _SYS_GETDENTS64 is not None else _list_dir_scandir
 
 def get_input_with_timeout(prompt, timeout=60):
     """
@@ -26,136 +171,523 @@ def get_input_with_timeout(prompt, timeout=60):
         print("\n[Timeout - skipping]")
         return None
 
+# Highest counter handed out per (parent, stem, suffix), so repeated
+# conflicts on the same name resume probing where the last call left
+# off instead of re-statting every lower number each time.
+_name_counters = {}
+
 def find_available_name(base_path, original_name):
     """
     Find an available filename by appending a number.
-    
+
     Args:
-        base_path: The parent directory path
+        base_path: The parent directory path string
         original_name: The original filename
-    
+
     Returns:
-        An available Path object with a number appended
+        An available filename string with a number appended
     """
-    path_obj = Path(original_name)
-    stem = path_obj.stem
-    suffix = path_obj.suffix
-    
-    counter = 1
+    stem, suffix = os.path.splitext(original_name)
+
+    key = (base_path, stem, suffix)
+    counter = _name_counters.get(key, 1)
     while True:
         new_name = f"{stem}_{counter}{suffix}"
-        new_path = base_path / new_name
-        if not new_path.exists():
-            return new_path
+        if not os.path.lexists(os.path.join(base_path, new_name)):
+            _name_counters[key] = counter + 1
+            return new_name
         counter += 1
 
-def rename_dash_prefix(root_path, dry_run=True):
+def _walk_post(dir_fd, dir_path):
     """
-    Recursively rename files and directories that start with ' - ' to start with '_'
-    
+    Recursively yield (dir_fd, dir_path, old_name, new_name) for entries
+    whose names start with ' - ', in post-order (children before their
+    parent) so nested matches are handled before the directory
+    containing them. The replacement name is computed once here rather
+    than at every later use; names that are nothing but the prefix are
+    left alone.
+
+    Each directory is opened once relative to its parent's fd and
+    listed through that fd (raw getdents64 on Linux, os.scandir
+    elsewhere); the yielded fd stays valid only until the generator
+    moves past that directory, so consumers must act on it immediately.
+
+    Symlinks are never followed: a symlinked directory is yielded (and
+    renamed) as the link itself but not descended into, which keeps the
+    walk bounded by the real subtree and out of external directories.
+
+    Directories that cannot be listed or opened (e.g. permission
+    denied) are skipped silently, matching os.walk's default onerror
+    behavior, so one unreadable subtree never aborts the walk.
+
+    Args:
+        dir_fd: An open O_DIRECTORY fd for dir_path
+        dir_path: The directory's full path (used for messages)
+    """
+    try:
+        entries = _list_dir(dir_fd)
+    except OSError:
+        return
+    for name, is_dir, is_match in entries:
+        if is_dir:
+            try:
+                child_fd = os.open(name,
+                                   os.O_RDONLY | os.O_DIRECTORY,
+                                   dir_fd=dir_fd)
+            except OSError:
+                child_fd = None
+            if child_fd is not None:
+                try:
+                    yield from _walk_post(child_fd, dir_path + os.sep + name)
+                finally:
+                    os.close(child_fd)
+        if is_match:
+            yield dir_fd, dir_path, name, '_' + name[3:]
+
+def _bottom_up_key(item):
+    """
+    Sort key for (dir, old_name, new_name) matches: depth descending so children are
+    renamed before their parent, then parent path so all renames within
+    a directory run back-to-back (keeping its dentries hot instead of
+    hopping between parents), then name for a stable order.
+    """
+    return (-item[0].count(os.sep), item[0], item[1])
+
+def _fixup_conflicts(conflicts, old_path, new_path):
+    """
+    Rewrite deferred conflict paths after a directory rename so they
+    still point at the items' current location.
+    """
+    if not conflicts:
+        return
+    old_prefix = old_path + os.sep
+    conflicts[:] = [
+        (new_path + os.sep + d[len(old_prefix):] if d.startswith(old_prefix)
+         else new_path if d == old_path else d, o, n)
+        for d, o, n in conflicts
+    ]
+
+# Submission queue depth for the io_uring rename path
+_URING_BATCH = 256
+
+def _rename_batch_uring(pairs):
+    """
+    Submit (old_path, new_path) renames through io_uring in batches of
+    _URING_BATCH, so one submit syscall covers many renames instead of
+    one mode switch each. Renames use RENAME_NOREPLACE, so an existing
+    target surfaces as FileExistsError rather than being clobbered.
+
+    Args:
+        pairs: List of (old_path, new_path) string tuples
+
+    Returns:
+        A list aligned with pairs: None for success, the OSError for
+        failures
+    """
+    results = [None] * len(pairs)
+    ring = liburing.Ring()
+    liburing.io_uring_queue_init(_URING_BATCH, ring)
+    try:
+        for start in range(0, len(pairs), _URING_BATCH):
+            chunk = pairs[start:start + _URING_BATCH]
+            for i, (old_path, new_path) in enumerate(chunk):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_rename(
+                    sqe, old_path, new_path, liburing.RENAME_NOREPLACE)
+                sqe.user_data = start + i
+            liburing.io_uring_submit_and_wait(ring, len(chunk))
+            cqe = liburing.Cqe()
+            seen = 0
+            while seen < len(chunk):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                ready = liburing.io_uring_cq_ready(ring)
+                for i in range(ready):
+                    entry = cqe[i]
+                    index = entry.user_data
+                    try:
+                        entry.res  # raises OSError when res < 0
+                    except OSError as exc:
+                        results[index] = exc
+                liburing.io_uring_cq_advance(ring, ready)
+                seen += ready
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return results
+
+def _scan_parallel(root, max_workers=16):
+    """
+    Collect (dir, old_name, new_name) matches using a thread pool, one scan task per
+    directory. On latency-bound filesystems (NFS, SMB, sshfs) this
+    overlaps the per-directory round trips that a sequential walk
+    serializes.
+
+    Results are sorted deepest-first so the bottom-up rename order is
+    preserved despite the unordered completion of scan tasks.
+
+    Args:
+        root: The directory path to scan
+        max_workers: Number of scanning threads
+    """
+    def scan_dir(dir_path):
+        found = []
+        subdirs = []
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            # Unreadable directory: skip it, like the sequential walk
+            return found, subdirs
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                name = entry.name
+                if name[0] == ' ' and name[:3] == PREFIX and len(name) > 3:
+                    found.append((dir_path, name, '_' + name[3:]))
+        return found, subdirs
+
+    matches = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(scan_dir, root)}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                found, subdirs = future.result()
+                matches.extend(found)
+                pending.update(pool.submit(scan_dir, d) for d in subdirs)
+
+    matches.sort(key=_bottom_up_key)
+    return matches
+
+def collect(root_path, workers=1):
+    """
+    Walk root_path and return its matches as a bottom-up sorted list of
+    (dir, old_name, new_name) tuples, or None if root_path is missing.
+
     Args:
         root_path: The directory to start searching from
-        dry_run: If True, only print what would be renamed without actually renaming
+        workers: If > 1, scan directories with this many threads
+            (useful on network filesystems)
     """
-    root = Path(root_path).resolve()
-    
-    if not root.exists():
+    root = os.path.realpath(root_path)
+
+    if not os.path.exists(root):
         print(f"Error: Path '{root_path}' does not exist")
-        return
-    
-    # Collect all items to rename (process depth-first to handle nested directories)
-    items_to_rename = []
-    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
-        current_dir = Path(dirpath)
-        
-        # Check files
-        for filename in filenames:
-            if filename.startswith(' - '):
-                items_to_rename.append(current_dir / filename)
-        
-        # Check directories
-        for dirname in dirnames:
-            if dirname.startswith(' - '):
-                items_to_rename.append(current_dir / dirname)
-    
-    if not items_to_rename:
+        return None
+
+    if workers > 1:
+        return _scan_parallel(root, workers)
+
+    try:
+        root_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError as e:
+        print(f"Error: Cannot open '{root_path}': {e.strerror}")
+        return None
+    try:
+        items = [item[1:] for item in _walk_post(root_fd, root)]
+    finally:
+        os.close(root_fd)
+    items.sort(key=_bottom_up_key)
+    return items
+
+def print_plan(items):
+    """
+    Print the dry-run plan for a collected item list without touching
+    anything.
+    """
+    if not items:
         print("No files or directories found starting with ' - '")
         return
-    
-    print(f"Found {len(items_to_rename)} item(s) to rename:\n")
-    
+
+    out = [f"Found {len(items)} item(s) to rename:\n"]
+
+    for dir_str, old_name, new_name in items:
+        old_path = dir_str + os.sep + old_name
+        new_path = dir_str + os.sep + new_name
+        if os.path.lexists(new_path):
+            out.append(f"[DRY RUN] Conflict: {old_path} -> {new_path} (target exists)")
+        else:
+            out.append(f"[DRY RUN] Would rename: {old_path} -> {new_path}")
+
+    out.append("\nDry run complete. Run with --execute to actually rename files.")
+    sys.stdout.write('\n'.join(out) + '\n')
+
+def _resolve_conflicts(conflicts, conflict_policy='prompt'):
+    """
+    Resolve deferred rename conflicts, by prompt or by batch policy.
+
+    Args:
+        conflicts: List of (dir, old_name, new_name) tuples whose
+            targets already existed
+        conflict_policy: 'rename' appends a number, 'skip' leaves
+            the item alone, 'prompt' asks per item
+
+    Returns:
+        (renamed_count, skipped_paths)
+    """
     renamed_count = 0
     skipped_items = []
-    
-    for item in items_to_rename:
-        old_name = item.name
-        new_name = '_' + old_name[3:]  # Remove ' - ' and add '_'
-        new_path = item.parent / new_name
-        
-        if dry_run:
-            if new_path.exists():
-                print(f"[DRY RUN] Conflict: {item} -> {new_path} (target exists)")
+    for dir_str, old_name, new_name in conflicts:
+        old_path = dir_str + os.sep + old_name
+        new_path = dir_str + os.sep + new_name
+        try:
+            if conflict_policy != 'prompt':
+                # Batch mode: never block on stdin
+                resolve = conflict_policy == 'rename'
             else:
-                print(f"[DRY RUN] Would rename: {item} -> {new_path}")
-        else:
-            try:
-                # Check if target already exists
-                if new_path.exists():
-                    print(f"\nConflict: Target already exists: {new_path}")
-                    response = get_input_with_timeout(
-                        "Choose action - (s)kip or (r)ename with number [s/r]: ",
-                        timeout=60
-                    )
-                    
-                    if response and response.lower() in ['r', 'rename']:
-                        # Find available name with number
-                        new_path = find_available_name(item.parent, new_name)
-                        item.rename(new_path)
-                        print(f"Renamed: {old_name} -> {new_path.name}")
-                        renamed_count += 1
-                    else:
-                        # Skip (either user chose skip or timeout occurred)
-                        print(f"Skipped: {old_name}")
-                        skipped_items.append(str(item))
-                else:
-                    # No conflict, rename normally
-                    item.rename(new_path)
-                    print(f"Renamed: {old_name} -> {new_name}")
+                print(f"\nConflict: Target already exists: {new_path}")
+                response = get_input_with_timeout(
+                    "Choose action - (s)kip or (r)ename with number [s/r]: ",
+                    timeout=60
+                )
+                resolve = bool(response) and response.lower() in ['r', 'rename']
+
+            if resolve:
+                # Find available name with number
+                numbered_name = find_available_name(dir_str, new_name)
+                os.rename(old_path, os.path.join(dir_str, numbered_name))
+                print(f"Renamed: {old_name} -> {numbered_name}")
+                renamed_count += 1
+            else:
+                # Skip (either user chose skip or timeout occurred)
+                print(f"Skipped: {old_name}")
+                skipped_items.append(old_path)
+        except Exception as e:
+            print(f"Error renaming {old_path}: {e}")
+            skipped_items.append(old_path)
+    return renamed_count, skipped_items
+
+def _iter_with_dir_fds(items):
+    """
+    Yield (dir_fd, dir, old_name, new_name) for a bottom-up item list,
+    opening each parent directory once and letting every rename inside
+    it go through that fd (renameat) instead of re-resolving the full
+    path per item. The list is sorted so a directory's items are
+    adjacent; only one fd is ever open at a time, and a directory that
+    cannot be opened falls back to full-path renames for its items.
+    """
+    for dir_path, group in groupby(items, key=lambda item: item[0]):
+        try:
+            dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            dir_fd = None
+        try:
+            for d, old_name, new_name in group:
+                yield dir_fd, d, old_name, new_name
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+def _execute_matches(source=None, items=None, conflict_policy='prompt'):
+    """
+    Rename matches, resolve deferred conflicts, and print a summary.
+
+    Exactly one of source/items is given. source streams
+    (dir_fd, dir_path, old_name, new_name) tuples straight from a walk
+    (dir_fd may be None); items is an already-collected bottom-up list
+    of (dir, old_name, new_name), which additionally enables io_uring
+    batch submission where available.
+    """
+    renamed_count = 0
+    skipped_items = []
+    conflicts = []
+    # Per-item messages are accumulated and emitted in one write;
+    # per-line print() flushes dominate once renames number in the
+    # tens of thousands.
+    out = []
+
+    def _attempt(dir_path, old_name, new_name, dir_fd=None):
+        """
+        Rename one match, deferring conflicts instead of prompting.
+
+        With dir_fd set, the existence check and rename go through the
+        directory fd (renameat), so the kernel skips re-resolving every
+        path component on each call.
+        """
+        nonlocal renamed_count
+        old_path = dir_path + os.sep + old_name
+        new_path = dir_path + os.sep + new_name
+        try:
+            if dir_fd is not None:
+                _rename_noreplace(old_name, new_name, dir_fd=dir_fd)
+            else:
+                _rename_noreplace(old_path, new_path)
+            # Deferred conflicts under a renamed directory now live
+            # under its new name
+            _fixup_conflicts(conflicts, old_path, new_path)
+            out.append(f"Renamed: {old_name} -> {new_name}")
+            renamed_count += 1
+        except FileExistsError:
+            # Defer conflicts so prompts don't stall the traversal
+            conflicts.append((dir_path, old_name, new_name))
+        except Exception as e:
+            out.append(f"Error renaming {old_path}: {e}")
+            skipped_items.append(old_path)
+
+    def _execute_batched(items):
+        """Rename a deepest-first item list through io_uring batches."""
+        nonlocal renamed_count
+        # Items at the same depth can never be ancestors of each other,
+        # so each depth level is safe to submit as one unordered batch.
+        for _, group in groupby(items, key=lambda item: item[0].count(os.sep)):
+            level = list(group)
+            pairs = [(d + os.sep + old, d + os.sep + new) for d, old, new in level]
+            for (d, old, new), (old_path, new_path), error in zip(
+                    level, pairs, _rename_batch_uring(pairs)):
+                if error is None:
+                    _fixup_conflicts(conflicts, old_path, new_path)
+                    out.append(f"Renamed: {old} -> {new}")
                     renamed_count += 1
-            except Exception as e:
-                print(f"Error renaming {item}: {e}")
-                skipped_items.append(str(item))
-    
-    if not dry_run:
-        print(f"\nSuccessfully renamed {renamed_count} item(s)")
-        if skipped_items:
-            print(f"\nSkipped {len(skipped_items)} item(s):")
-            for skipped in skipped_items:
-                print(f"  - {skipped}")
-    else:
-        print(f"\nDry run complete. Run with --execute to actually rename files.")
+                elif isinstance(error, FileExistsError):
+                    conflicts.append((d, old, new))
+                else:
+                    out.append(f"Error renaming {old_path}: {error}")
+                    skipped_items.append(old_path)
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python rename_dash_files.py <directory>")
-        sys.exit(1)
-    
-    target_dir = sys.argv[1]
-    
-    # Ask user if they want to do a dry run first
-    response = input("\nDo you want to do a dry run first? (y/n): ").strip().lower()
-    
-    if response in ['y', 'yes']:
-        print("\n=== DRY RUN ===")
-        rename_dash_prefix(target_dir, dry_run=True)
-        
-        # Ask if they want to proceed with actual renaming
-        proceed = input("\nProceed with actual renaming? (y/n): ").strip().lower()
-        if proceed in ['y', 'yes']:
-            print("\n=== EXECUTING RENAMES ===")
-            rename_dash_prefix(target_dir, dry_run=False)
+    if items is not None:
+        if liburing is not None and sys.platform == 'linux':
+            _execute_batched(items)
         else:
-            print("Cancelled.")
+            source = _iter_with_dir_fds(items)
+
+    if source is not None:
+        for dir_fd, dir_path, old_name, new_name in source:
+            _attempt(dir_path, old_name, new_name, dir_fd=dir_fd)
+
+    # Flush the batched messages before any interactive prompts
+    if out:
+        sys.stdout.write('\n'.join(out) + '\n')
+
+    # Resolve deferred conflicts once the traversal is done
+    resolved, skipped = _resolve_conflicts(conflicts, conflict_policy)
+    renamed_count += resolved
+    skipped_items.extend(skipped)
+
+    if renamed_count == 0 and not skipped_items:
+        print("No files or directories found starting with ' - '")
+        return
+
+    print(f"\nSuccessfully renamed {renamed_count} item(s)")
+    if skipped_items:
+        print(f"\nSkipped {len(skipped_items)} item(s):")
+        for skipped in skipped_items:
+            print(f"  - {skipped}")
+
+def execute(items, conflict_policy='prompt'):
+    """
+    Rename an already-collected bottom-up list of (dir, old_name,
+    new_name) matches. Lets the interactive flow reuse the dry-run's
+    collection instead of walking the tree a second time.
+    """
+    _execute_matches(items=items, conflict_policy=conflict_policy)
+
+def rename_dash_prefix(root_path, dry_run=True, workers=1,
+                       conflict_policy='prompt'):
+    """
+    Recursively rename files and directories that start with ' - ' to start with '_'
+
+    Symlinks are never followed: a matching symlink is renamed in place
+    (a constant-time operation on the link, not its target), but the
+    walk does not descend through it, so loops and external directories
+    are never visited.
+
+    Args:
+        root_path: The directory to start searching from
+        dry_run: If True, only print what would be renamed without actually renaming
+        workers: If > 1, scan directories with this many threads
+            (useful on network filesystems)
+        conflict_policy: How to handle an existing target - 'prompt'
+            asks per item, 'rename' appends a number, 'skip' leaves
+            the item alone
+    """
+    if dry_run:
+        items = collect(root_path, workers)
+        if items is not None:
+            print_plan(items)
+        return
+
+    root = os.path.realpath(root_path)
+
+    if not os.path.exists(root):
+        print(f"Error: Path '{root_path}' does not exist")
+        return
+
+    if workers > 1:
+        # Parallel scan first, then rename deepest-first from the list
+        _execute_matches(items=_scan_parallel(root, workers),
+                         conflict_policy=conflict_policy)
+        return
+
+    # Single fused pass: rename each match as the walk yields it
+    try:
+        root_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError as e:
+        print(f"Error: Cannot open '{root_path}': {e.strerror}")
+        return
+    try:
+        _execute_matches(source=_walk_post(root_fd, root),
+                         conflict_policy=conflict_policy)
+    finally:
+        os.close(root_fd)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Recursively rename files and directories whose "
+                    "names start with ' - ' to start with '_'.")
+    parser.add_argument('directory', help='directory to scan recursively')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--dry-run', action='store_true',
+                      help='only print what would be renamed')
+    mode.add_argument('--execute', action='store_true',
+                      help='rename immediately, skipping the interactive '
+                           'dry-run offer')
+    conflict = parser.add_mutually_exclusive_group()
+    conflict.add_argument('-y', '--yes', action='store_true',
+                          help='resolve conflicts by appending a number '
+                               'instead of prompting')
+    conflict.add_argument('--skip-conflicts', action='store_true',
+                          help='skip conflicting items instead of prompting')
+    conflict.add_argument('--on-conflict',
+                          choices=('prompt', 'skip', 'rename'),
+                          help='conflict policy; --yes and '
+                               '--skip-conflicts are shorthands for '
+                               'rename and skip')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help='scan with N threads (useful on network '
+                             'filesystems)')
+    args = parser.parse_args()
+
+    conflict_policy = args.on_conflict or (
+        'rename' if args.yes else 'skip' if args.skip_conflicts else 'prompt')
+
+    if args.dry_run:
+        rename_dash_prefix(args.directory, dry_run=True, workers=args.workers)
+    elif args.execute:
+        rename_dash_prefix(args.directory, dry_run=False,
+                           workers=args.workers,
+                           conflict_policy=conflict_policy)
     else:
-        print("\n=== EXECUTING RENAMES ===")
-        rename_dash_prefix(target_dir, dry_run=False)
+        # No mode flag: keep the interactive flow
+        response = input("\nDo you want to do a dry run first? (y/n): ").strip().lower()
+
+        if response in ['y', 'yes']:
+            print("\n=== DRY RUN ===")
+            # Walk once: the execute step reuses the dry run's
+            # collection, so accepting renames exactly what was shown
+            items = collect(args.directory, workers=args.workers)
+            if items is None:
+                sys.exit(1)
+            print_plan(items)
+
+            # Ask if they want to proceed with actual renaming
+            proceed = input("\nProceed with actual renaming? (y/n): ").strip().lower()
+            if proceed in ['y', 'yes']:
+                print("\n=== EXECUTING RENAMES ===")
+                execute(items, conflict_policy=conflict_policy)
+            else:
+                print("Cancelled.")
+        else:
+            print("\n=== EXECUTING RENAMES ===")
+            rename_dash_prefix(args.directory, dry_run=False,
+                               workers=args.workers,
+                           conflict_policy=conflict_policy)